@@ -1,128 +1,202 @@
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
+# Plotly is imported inside the chart builders so that importing this module
+# for the stats alone does not pay its import cost
 
-def calculate_completion_stats(logs_df, habits_df):
-    # Pre-define empty DataFrames with columns to avoid Plotly errors
-    empty_consistency = pd.DataFrame(columns=["Date", "Completed Count"])
-    empty_top = pd.DataFrame(columns=["Habit Name", "Total Completed"])
-    empty_weekly = pd.DataFrame(columns=["Week", "Completed Count"])
 
-    if habits_df is None or habits_df.empty:
-        return {
-            "overall_rate": 0,
-            "daily_consistency": empty_consistency,
-            "top_habits": empty_top,
-            "weekly_comparison": empty_weekly,
-            "good_vs_bad": {"good": 0, "bad": 0},
-        }
+def _hash_frame(df):
+    """Cheap cache key for a DataFrame: shape, columns and a digest of its rows."""
+    return (df.shape, tuple(df.columns), int(pd.util.hash_pandas_object(df).sum()))
+
+
+def _habit_cols(logs_df):
+    """Returns the H<ID> habit columns, preferring the list cached by the loader."""
+    cols = logs_df.attrs.get("habit_cols")
+    if cols is None:
+        cols = [c for c in logs_df.columns if c.startswith("H")]
+    return list(cols)
+
+
+def _status_codes(logs_df, habit_cols):
+    """Returns an int8 matrix over the habit cells: 1 = Yes, -1 = No, 0 = missing.
+
+    Supports legacy True/False values alongside the Yes/No labels.
+    """
+    habit_df = logs_df[habit_cols]
+    if all(
+        isinstance(t, pd.CategoricalDtype) and list(t.categories) == ["No", "Yes"]
+        for t in habit_df.dtypes
+    ):
+        # Fast path: No/Yes categoricals from GithubHandler.get_logs, whose
+        # codes (-1 missing, 0 No, 1 Yes) are remapped with one table gather
+        cat_codes = np.column_stack(
+            [habit_df[c].cat.codes.to_numpy() for c in habit_cols]
+        )
+        return np.array([0, -1, 1], dtype=np.int8)[cat_codes + 1]
+
+    cells = habit_df.to_numpy(dtype=object)
+    codes = np.zeros(cells.shape, dtype=np.int8)
+    codes[(cells == "Yes") | (cells == True)] = 1
+    codes[(cells == "No") | (cells == False)] = -1
+    return codes
 
+
+def _habit_names(habits_df, habit_ids):
+    """Looks up the habit name for each ID, NaN where the habit no longer exists."""
+    # Log columns are written in habit order, so usually the IDs line up as-is
+    if habits_df["ID"].tolist() == habit_ids:
+        return habits_df["Habit Name"].to_numpy()
+    return habits_df.set_index("ID")["Habit Name"].reindex(habit_ids).to_numpy()
+
+
+def _empty_stats():
+    # Pre-define empty DataFrames with columns to avoid Plotly errors
+    return {
+        "overall_rate": 0,
+        "daily_consistency": pd.DataFrame(columns=["Date", "Completed Count"]),
+        "top_habits": pd.DataFrame(columns=["Habit Name", "Total Completed"]),
+        "weekly_comparison": pd.DataFrame(columns=["Week", "Completed Count"]),
+        "habit_breakdown": pd.DataFrame(columns=["Habit Name", "Yes", "No"]),
+        "good_vs_bad": {"good": 0, "bad": 0},
+    }
+
+
+def _validate_inputs(logs_df, habits_df):
+    """Returns the habit columns to analyse, or [] when there is nothing to compute."""
+    if habits_df is None or habits_df.empty:
+        return []
+    if not {"ID", "Habit Name"}.issubset(habits_df.columns):
+        return []
     # If habits exist but logs don't
     if logs_df is None or logs_df.empty:
-        return {
-            "overall_rate": 0,
-            "daily_consistency": empty_consistency,
-            "top_habits": empty_top,
-            "weekly_comparison": empty_weekly,
-            "good_vs_bad": {"good": 0, "bad": 0},
-        }
+        return []
+    return _habit_cols(logs_df)
 
-    try:
-        habit_cols = [c for c in logs_df.columns if c.startswith("H")]
-        if not habit_cols:
-            return {
-                "overall_rate": 0,
-                "daily_consistency": empty_consistency,
-                "top_habits": empty_top,
-                "weekly_comparison": empty_weekly,
-                "good_vs_bad": {"good": 0, "bad": 0},
-            }
 
-        # For Yes/No model, we consider "Yes" as completed
-        # Support legacy True/False and new Yes/No
-        is_yes = (logs_df[habit_cols] == "Yes") | (logs_df[habit_cols] == True)
-        is_no = (logs_df[habit_cols] == "No") | (logs_df[habit_cols] == False)
-
-        total_yes = is_yes.sum().sum()
-        total_no = is_no.sum().sum()
-        total_cells = logs_df[habit_cols].size
-
-        overall_rate = (total_yes / total_cells) * 100 if total_cells > 0 else 0
-
-        # Daily consistency (only counting 'Yes')
-        if "Date" in logs_df.columns:
-            daily_consistency = is_yes.sum(axis=1).reset_index()
-            daily_consistency.columns = ["index", "Completed Count"]
-            daily_consistency["Date"] = logs_df["Date"]
-            daily_consistency = daily_consistency[["Date", "Completed Count"]]
-        else:
-            daily_consistency = empty_consistency
-
-        # Top habits (only counting 'Yes')
-        habit_totals = is_yes.sum().reset_index()
-        habit_totals.columns = ["H_ID", "Total Completed"]
-        habit_totals["ID"] = habit_totals["H_ID"].str.replace("H", "", regex=False)
-
-        top_habits = pd.merge(habit_totals, habits_df, on="ID")
-        top_habits = top_habits.sort_values(by="Total Completed", ascending=False)
-
-        # Weekly comparison
-        if "Date" in logs_df.columns:
-            logs_copy = logs_df.copy()
-            logs_copy["Date"] = pd.to_datetime(logs_copy["Date"])
-            logs_copy["Week"] = logs_copy["Date"].dt.isocalendar().week
-            logs_copy["is_yes_sum"] = is_yes.sum(axis=1)
-            weekly_comp = logs_copy.groupby("Week")["is_yes_sum"].sum().reset_index()
-            weekly_comp.columns = ["Week", "Completed Count"]
-        else:
-            weekly_comp = empty_weekly
-
-        return {
-            "overall_rate": overall_rate,
-            "daily_consistency": daily_consistency,
-            "top_habits": top_habits,
-            "weekly_comparison": weekly_comp,
-            "good_vs_bad": {"good": total_yes, "bad": total_no},
-        }
-    except Exception as e:
-        st.error(f"Error in analytics: {e}")
-        return {
-            "overall_rate": 0,
-            "daily_consistency": empty_consistency,
-            "top_habits": empty_top,
-            "weekly_comparison": empty_weekly,
-            "good_vs_bad": {"good": 0, "bad": 0},
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def calculate_completion_stats(logs_df, habits_df):
+    habit_cols = _validate_inputs(logs_df, habits_df)
+    if not habit_cols:
+        return _empty_stats()
+
+    # For Yes/No model, we consider "Yes" as completed
+    codes = _status_codes(logs_df, habit_cols)
+    is_yes = codes > 0
+
+    # Reduce once and reuse the per-habit / per-day vectors below
+    col_yes = is_yes.sum(axis=0)
+    col_no = (codes < 0).sum(axis=0)
+    row_yes = is_yes.sum(axis=1)
+    total_yes = col_yes.sum()
+    total_no = col_no.sum()
+    total_cells = codes.size
+
+    overall_rate = (total_yes / total_cells) * 100 if total_cells > 0 else 0
+
+    # Daily consistency (only counting 'Yes')
+    if "Date" in logs_df.columns:
+        daily_consistency = pd.DataFrame(
+            {
+                "Date": logs_df["Date"].to_numpy(),
+                "Completed Count": row_yes,
+            }
+        )
+    else:
+        daily_consistency = _empty_stats()["daily_consistency"]
+
+    # Top habits (only counting 'Yes')
+    habit_ids = [c[1:] for c in habit_cols]
+    habit_names = _habit_names(habits_df, habit_ids)
+    top_habits = pd.DataFrame(
+        {
+            "H_ID": habit_cols,
+            "ID": habit_ids,
+            "Total Completed": col_yes,
+            "Habit Name": habit_names,
         }
+    ).dropna(subset=["Habit Name"])
+    top_habits = top_habits.sort_values(by="Total Completed", ascending=False)
+
+    # Per-habit Yes vs No, consumed by create_habit_performance_chart
+    habit_breakdown = pd.DataFrame(
+        {"Habit Name": habit_names, "Yes": col_yes, "No": col_no}
+    ).dropna(subset=["Habit Name"])
+
+    # Weekly comparison
+    if "Date" in logs_df.columns:
+        days = (
+            pd.to_datetime(logs_df["Date"], cache=True)
+            .to_numpy("datetime64[D]")
+            .astype(np.int64)
+        )
+        # Monday-aligned week index (1970-01-05 was a Monday); only the few
+        # grouped weeks are mapped back to ISO week numbers for display
+        weekly = pd.Series(row_yes).groupby((days + 3) // 7).sum()
+        week_starts = pd.to_datetime(weekly.index.to_numpy() * 7 - 3, unit="D")
+        weekly_comp = pd.DataFrame(
+            {
+                "Week": week_starts.isocalendar()["week"].to_numpy(),
+                "Completed Count": weekly.to_numpy(),
+            }
+        )
+    else:
+        weekly_comp = _empty_stats()["weekly_comparison"]
+
+    return {
+        "overall_rate": overall_rate,
+        "daily_consistency": daily_consistency,
+        "top_habits": top_habits,
+        "weekly_comparison": weekly_comp,
+        "habit_breakdown": habit_breakdown,
+        "good_vs_bad": {"good": total_yes, "bad": total_no},
+    }
 
 
 def create_donut_chart(rate):
+    # Rounded to the displayed precision so near-identical rates share a figure
+    return _donut_chart(round(float(rate), 1))
+
+
+@st.cache_resource(show_spinner=False)
+def _donut_chart(rate):
+    import plotly.graph_objects as go
+
+    # Known-good static properties, so Plotly's per-property validation is skipped
     try:
-        fig = go.Figure(
+        return go.Figure(
             data=[
                 go.Pie(
                     labels=["Completed", "Remaining"],
                     values=[rate, max(0, 100 - rate)],
                     hole=0.7,
                     marker_colors=["#2ECC71", "#ECF0F1"],
+                    _validate=False,
                 )
-            ]
-        )
-        fig.update_layout(
-            showlegend=False,
-            annotations=[
-                dict(text=f"{rate:.1f}%", x=0.5, y=0.5, font_size=20, showarrow=False)
             ],
-            margin=dict(t=0, b=0, l=0, r=0),
-            height=200,
+            layout=go.Layout(
+                showlegend=False,
+                annotations=[
+                    dict(
+                        text=f"{rate:.1f}%", x=0.5, y=0.5, font_size=20, showarrow=False
+                    )
+                ],
+                margin=dict(t=0, b=0, l=0, r=0),
+                height=200,
+                _validate=False,
+            ),
+            _validate=False,
         )
-        return fig
-    except:
+    except (KeyError, ValueError, TypeError):
         return go.Figure()
 
 
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
 def create_line_chart(df):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     if df is None or df.empty or "Date" not in df.columns:
         fig = go.Figure()
         fig.update_layout(title="Daily Consistency (No Data)")
@@ -131,13 +205,17 @@ def create_line_chart(df):
         fig = px.line(df, x="Date", y="Completed Count", title="Daily Consistency")
         fig.update_layout(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)")
         return fig
-    except Exception as e:
+    except (KeyError, ValueError, TypeError) as e:
         fig = go.Figure()
         fig.update_layout(title=f"Error creating line chart: {e}")
         return fig
 
 
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
 def create_bar_chart(df):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     if df is None or df.empty or "Week" not in df.columns:
         fig = go.Figure()
         fig.update_layout(title="Weekly Performance (No Data)")
@@ -146,16 +224,21 @@ def create_bar_chart(df):
         fig = px.bar(df, x="Week", y="Completed Count", title="Weekly Performance")
         fig.update_layout(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)")
         return fig
-    except Exception as e:
+    except (KeyError, ValueError, TypeError) as e:
         fig = go.Figure()
         fig.update_layout(title=f"Error creating bar chart: {e}")
         return fig
 
 
 def create_tug_of_war_chart(counts):
+    return _tug_of_war_chart(int(counts.get("good", 0)), int(counts.get("bad", 0)))
+
+
+@st.cache_resource(show_spinner=False)
+def _tug_of_war_chart(good, bad):
+    import plotly.graph_objects as go
+
     try:
-        good = counts.get("good", 0)
-        bad = counts.get("bad", 0)
         total = good + bad
 
         if total == 0:
@@ -163,78 +246,59 @@ def create_tug_of_war_chart(counts):
             fig.update_layout(title="Tug of War: No Data")
             return fig
 
-        good_pct = (good / total) * 100
-        bad_pct = (bad / total) * 100
-
-        fig = go.Figure()
-
-        # Add "Good" side (Green)
-        fig.add_trace(
-            go.Bar(
-                y=["Balance"],
-                x=[good],
-                name="Good Habits",
-                orientation="h",
-                marker_color="#2ECC71",
-            )
-        )
-
-        # Add "Bad" side (Red)
-        fig.add_trace(
-            go.Bar(
-                y=["Balance"],
-                x=[bad],
-                name="Bad Habits",
-                orientation="h",
-                marker_color="#E74C3C",
-            )
-        )
-
-        fig.update_layout(
-            barmode="stack",
-            title="⚔️ Good vs Bad: Tug of War",
-            xaxis_title="Completions Count",
-            yaxis_visible=False,
-            height=200,
-            showlegend=True,
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            margin=dict(t=50, b=30, l=10, r=10),
+        # Built unvalidated in one go, as in _donut_chart
+        return go.Figure(
+            data=[
+                # "Good" side (Green)
+                go.Bar(
+                    y=["Balance"],
+                    x=[good],
+                    name="Good Habits",
+                    orientation="h",
+                    marker_color="#2ECC71",
+                    _validate=False,
+                ),
+                # "Bad" side (Red)
+                go.Bar(
+                    y=["Balance"],
+                    x=[bad],
+                    name="Bad Habits",
+                    orientation="h",
+                    marker_color="#E74C3C",
+                    _validate=False,
+                ),
+            ],
+            layout=go.Layout(
+                barmode="stack",
+                title="⚔️ Good vs Bad: Tug of War",
+                xaxis_title="Completions Count",
+                yaxis_visible=False,
+                height=200,
+                showlegend=True,
+                plot_bgcolor="rgba(0,0,0,0)",
+                paper_bgcolor="rgba(0,0,0,0)",
+                margin=dict(t=50, b=30, l=10, r=10),
+                _validate=False,
+            ),
+            _validate=False,
         )
-
-        return fig
-    except Exception as e:
+    except (KeyError, ValueError, TypeError) as e:
         fig = go.Figure()
         fig.update_layout(title=f"Error creating Tug of War: {e}")
         return fig
 
 
-def create_habit_performance_chart(habits_df, logs_df):
-    try:
-        if habits_df is None or habits_df.empty or logs_df is None or logs_df.empty:
-            fig = go.Figure()
-            fig.update_layout(title="Habit Performance: No Data")
-            return fig
-
-        habit_cols = [c for c in logs_df.columns if c.startswith("H")]
-        if not habit_cols:
-            return go.Figure()
-
-        # Support legacy and new labels
-        is_yes = (logs_df[habit_cols] == "Yes") | (logs_df[habit_cols] == True)
-        is_no = (logs_df[habit_cols] == "No") | (logs_df[habit_cols] == False)
-
-        yes_counts = is_yes.sum().reset_index()
-        yes_counts.columns = ["H_ID", "Yes"]
-
-        no_counts = is_no.sum().reset_index()
-        no_counts.columns = ["H_ID", "No"]
-
-        counts = pd.merge(yes_counts, no_counts, on="H_ID")
-        counts["ID"] = counts["H_ID"].str.replace("H", "", regex=False)
-
-        df = pd.merge(counts, habits_df, on="ID")
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def create_habit_performance_chart(df):
+    """Grouped Yes/No bars from the "habit_breakdown" frame of the stats."""
+    import plotly.express as px
+    import plotly.graph_objects as go
 
+    if df is None or df.empty or "Habit Name" not in df.columns:
+        fig = go.Figure()
+        fig.update_layout(title="Habit Performance: No Data")
+        return fig
+    try:
         # Melt for Plotly express
         df_melted = df.melt(
             id_vars=["Habit Name"],
@@ -260,51 +324,46 @@ def create_habit_performance_chart(habits_df, logs_df):
             yaxis_title="Count",
         )
         return fig
-    except Exception as e:
+    except (KeyError, ValueError, TypeError) as e:
         fig = go.Figure()
         fig.update_layout(title=f"Error creating performance chart: {e}")
         return fig
 
 
-def create_overall_trends_chart(all_data):
-    """Visualizes month-over-month completion rates and mood."""
-    try:
-        logs_df = pd.DataFrame(all_data.get("logs", []))
-        metrics_df = pd.DataFrame(all_data.get("metrics", []))
+def summarize_month(year, month, month_data):
+    """Reduces one monthly data file to the row plotted by the trends chart."""
+    logs_df = pd.DataFrame(month_data.get("logs", []))
+    if logs_df.empty:
+        return None
+    habit_cols = _habit_cols(logs_df)
+    if not habit_cols:
+        return None
+
+    summary = {
+        "Month": f"{year}-{month:02d}",
+        "Monthly_Sum": int((_status_codes(logs_df, habit_cols) > 0).sum()),
+        # Every recorded cell counts as a possible completion
+        "Total_Possible": int(logs_df[habit_cols].notna().to_numpy().sum()),
+    }
+    mood = pd.DataFrame(month_data.get("metrics", [])).get("Mood (1-10)")
+    if mood is not None:
+        # Hand-edited or migrated files can hold blank or non-numeric moods
+        summary["Mood (1-10)"] = pd.to_numeric(mood, errors="coerce").mean()
+    return summary
+
+
+@st.cache_resource(show_spinner=False)
+def create_overall_trends_chart(summaries):
+    """Visualizes month-over-month completion rates and mood from summarize_month rows."""
+    import plotly.graph_objects as go
 
-        if logs_df.empty:
+    try:
+        if not summaries:
             return go.Figure().update_layout(title="No historical data found")
 
-        logs_df["Date"] = pd.to_datetime(logs_df["Date"])
-        logs_df["Month"] = logs_df["Date"].dt.strftime("%Y-%m")
-
-        habit_cols = [c for c in logs_df.columns if c.startswith("H")]
-        if not habit_cols:
-            return go.Figure()
-
-        # Calculate completion rate per month
-        is_yes = (logs_df[habit_cols] == "Yes") | (logs_df[habit_cols] == True)
-        logs_df["Monthly_Sum"] = is_yes.sum(axis=1)
-
-        monthly_stats = logs_df.groupby("Month")["Monthly_Sum"].sum().reset_index()
-        # Count total potential items
-        monthly_total_habits = (
-            logs_df.groupby("Month")[habit_cols].count().sum(axis=1).reset_index()
-        )
-        monthly_total_habits.columns = ["Month", "Total_Possible"]
-
-        df = pd.merge(monthly_stats, monthly_total_habits, on="Month")
+        df = pd.DataFrame(summaries)
         df["Completion Rate (%)"] = (df["Monthly_Sum"] / df["Total_Possible"]) * 100
 
-        # Add Mood if available
-        if not metrics_df.empty:
-            metrics_df["Date"] = pd.to_datetime(metrics_df["Date"])
-            metrics_df["Month"] = metrics_df["Date"].dt.strftime("%Y-%m")
-            monthly_mood = (
-                metrics_df.groupby("Month")["Mood (1-10)"].mean().reset_index()
-            )
-            df = pd.merge(df, monthly_mood, on="Month", how="left")
-
         fig = go.Figure()
 
         # Bars for Completion Rate
@@ -342,7 +401,7 @@ def create_overall_trends_chart(all_data):
         )
 
         return fig
-    except Exception as e:
+    except (KeyError, ValueError, TypeError) as e:
         fig = go.Figure()
         fig.update_layout(title=f"Error creating trends chart: {e}")
         return fig
@@ -2,10 +2,10 @@ import streamlit as st
 import datetime
 import calendar
 import pandas as pd
-import json
 import os
 import random
 import uuid
+from functools import lru_cache
 from fpdf import FPDF
 from github_handler import GithubHandler
 from analytics import (
@@ -16,6 +16,7 @@ from analytics import (
     create_tug_of_war_chart,
     create_habit_performance_chart,
     create_overall_trends_chart,
+    summarize_month,
 )
 
 # VERSION 1.4 - GitHub Gist Backend
@@ -126,6 +127,164 @@ def login_page():
         st.markdown("</div>", unsafe_allow_html=True)
 
 
+_MONTH_NAMES = list(calendar.month_name)
+_MONTH_INDEX = {name: i for i, name in enumerate(_MONTH_NAMES) if name}
+# Stored log values, including booleans from older data files
+_YES = frozenset({True, "Yes"})
+_NO = frozenset({False, "No"})
+
+
+@lru_cache(maxsize=None)
+def _monthrange(year, month):
+    return calendar.monthrange(year, month)
+
+
+def get_handler():
+    """Returns the session's GithubHandler, rebuilt only when the account changes."""
+    key = "local" if st.session_state.local_mode else st.session_state.gist_id
+    if st.session_state.get("handler_key") != key or "handler" not in st.session_state:
+        if st.session_state.local_mode:
+            st.session_state.handler = GithubHandler(local=True)
+        else:
+            st.session_state.handler = GithubHandler(
+                token=st.session_state.git_token, gist_id=st.session_state.gist_id
+            )
+        st.session_state.handler_key = key
+    return st.session_state.handler
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_frames(_handler, source, version):
+    """Frames for the handler's loaded habits and month.
+
+    Keyed on the handler's source and the digests of those two files, so a
+    hit always matches what the handler itself holds.
+    """
+    logs_by_date, metrics_by_date = _handler.get_day_records()
+    return (
+        _handler.get_habits(),
+        _handler.get_logs(),
+        _handler.get_metrics(),
+        logs_by_date,
+        metrics_by_date,
+    )
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_available_months(_handler, source, version):
+    """(year, month) pairs that have a data file, keyed on the listing's digests."""
+    return _handler.get_all_available_months()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_month_summaries(_handler, source, version):
+    """One small summary row per month, so raw history is never kept in the cache."""
+    summaries = (summarize_month(*month) for month in _handler.iter_month_data())
+    return [s for s in summaries if s]
+
+
+def clear_data_caches():
+    load_frames.clear()
+    load_available_months.clear()
+    load_month_summaries.clear()
+
+
+def clear_session_handler():
+    st.session_state.pop("handler", None)
+    st.session_state.pop("handler_key", None)
+    clear_data_caches()
+
+
+@st.cache_data(show_spinner=False)
+def build_journal_pdf(title, journal_data):
+    """Renders a month's journal entries to PDF bytes."""
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 16)
+    pdf.cell(0, 10, title, ln=True, align="C")
+    pdf.ln(10)
+
+    # Sort entries by date
+    for d_str in sorted(journal_data.keys()):
+        content = journal_data[d_str]
+        if content.strip():
+            pdf.set_font("Arial", "B", 12)
+            pdf.cell(0, 10, f"Date: {d_str}", ln=True)
+            pdf.set_font("Arial", "", 11)
+            pdf.multi_cell(0, 8, content)
+            pdf.ln(5)
+
+    # fpdf2 returns a bytearray; convert once so the cached value is immutable
+    return bytes(pdf.output())
+
+
+@st.fragment
+def journal_view(handler, year, month, month_name, start_date, end_date):
+    """Journal editor and export; its widgets rerun only this fragment."""
+    st.subheader(f"🖋️ Daily Journal - {month_name} {year}")
+
+    # Date selector for journal
+    j_date = st.date_input(
+        "Journal Date",
+        datetime.date.today(),
+        min_value=start_date,
+        max_value=end_date,
+        key="journal_date_selector",
+    )
+
+    # Load journal for the selected month
+    journal_data = handler.load_journal(year, month)
+    date_str = j_date.strftime("%Y-%m-%d")
+    current_entry = journal_data.get(date_str, "")
+
+    # Typing only reruns the script when the entry is submitted
+    with st.form("journal_form"):
+        journal_content = st.text_area(
+            "Write your thoughts here...",
+            value=current_entry,
+            height=300,
+            key=f"journal_input_{date_str}",
+        )
+
+        if st.form_submit_button("Save Journal Entry", type="primary"):
+            with st.spinner("Saving journal..."):
+                saved = handler.save_journal(j_date, journal_content)
+            if saved:
+                st.success("Journal entry saved!")
+                st.rerun()
+            else:
+                st.error("Failed to save to GitHub. Please try again.")
+
+    st.divider()
+    st.subheader("📥 Export Journal")
+
+    if st.button("Generate Monthly PDF"):
+        if not journal_data:
+            st.warning("No journal entries found for this month.")
+        else:
+            try:
+                pdf_bytes = build_journal_pdf(
+                    f"Habit Tracker Journal - {month_name} {year}", journal_data
+                )
+                st.download_button(
+                    label="Download PDF",
+                    data=pdf_bytes,
+                    file_name=f"Journal_{year}_{month:02d}.pdf",
+                    mime="application/pdf",
+                )
+            except Exception as e:
+                st.error(f"Error generating PDF: {e}")
+
+    # Quick view of past entries this month
+    if journal_data:
+        with st.expander("📖 View Past Entries (This Month)"):
+            for d_str in sorted(journal_data.keys(), reverse=True):
+                if journal_data[d_str].strip():
+                    st.markdown(f"**{d_str}**")
+                    st.info(journal_data[d_str])
+
+
 def main():
     # Authentication check
     if not st.session_state.local_mode and not (
@@ -143,58 +302,63 @@ def main():
             st.session_state.git_token = ""
             st.session_state.gist_id = ""
             st.session_state.local_mode = False
+            clear_session_handler()
             st.rerun()
 
     # Calendar Settings in Header columns
+    now = datetime.datetime.now()
     cal_col1, cal_col2, cal_col3 = st.columns([2, 2, 8])
     with cal_col1:
-        year = st.selectbox(
-            "Year", range(2024, 2030), index=datetime.datetime.now().year - 2024
-        )
+        year = st.selectbox("Year", range(2024, 2030), index=now.year - 2024)
     with cal_col2:
-        month_name = st.selectbox(
-            "Month", calendar.month_name[1:], index=datetime.datetime.now().month - 1
-        )
-    month = list(calendar.month_name).index(month_name)
+        month_name = st.selectbox("Month", _MONTH_NAMES[1:], index=now.month - 1)
+    month = _MONTH_INDEX[month_name]
     start_date = datetime.date(year, month, 1)
-    _, last_day = calendar.monthrange(year, month)
+    _, last_day = _monthrange(year, month)
     end_date = datetime.date(year, month, last_day)
 
-    # Initialize handler
-    if st.session_state.local_mode:
-        handler = GithubHandler(local=True)
-    else:
-        handler = GithubHandler(
-            token=st.session_state.git_token, gist_id=st.session_state.gist_id
-        )
+    # Initialize handler (kept across reruns in session_state)
+    handler = get_handler()
 
-    # Load data for specific month
+    # Load data for specific month; refresh picks up edits from other sessions
     try:
-        handler.load_month(year, month)
-        habits_df = handler.get_habits()
-
-        logs_df = handler.get_logs()
-        metrics_df = handler.get_metrics()
+        handler.refresh(year, month)
+        habits_df, logs_df, metrics_df, logs_by_date, metrics_by_date = load_frames(
+            handler,
+            handler.source(),
+            handler.content_version(
+                handler.habits_filename, f"data_{year}_{month:02d}.json"
+            ),
+        )
     except Exception as e:
         st.error(f"Error loading data: {e}")
         if st.button("Return to Login"):
             st.session_state.git_token = ""
             st.session_state.local_mode = False
+            clear_session_handler()
             st.rerun()
         st.stop()
 
-    tab_guide, tab1, tab2, tab4, tab5, tab3 = st.tabs(
-        [
-            "🏠 Guide",
-            "📅 Daily Tracker",
-            "📊 Dashboard",
-            "📈 Overall Analysis",
-            "🖋️ Daily Journal",
-            "⚙️ Habit Settings",
-        ]
+    views = [
+        "🏠 Guide",
+        "📅 Daily Tracker",
+        "📊 Dashboard",
+        "📈 Overall Analysis",
+        "🖋️ Daily Journal",
+        "⚙️ Habit Settings",
+    ]
+    tab_guide, tab1, tab2, tab4, tab5, tab3 = views
+    # st.tabs runs every tab body on each rerun; with a radio only the selected
+    # view executes, so e.g. the dashboard figures aren't built while logging
+    active_view = st.radio(
+        "View",
+        views,
+        horizontal=True,
+        key="active_view",
+        label_visibility="collapsed",
     )
 
-    with tab_guide:
+    if active_view == tab_guide:
         st.markdown(
             """
             <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 20px; color: white; margin-bottom: 30px; box-shadow: 0 10px 20px rgba(0,0,0,0.2);'>
@@ -252,7 +416,7 @@ def main():
             "every checkmark is a vote for the person you want to become."
         )
 
-    with tab3:
+    if active_view == tab3:
         st.subheader("Configure Your Habits")
         st.info("Your settings are synced to the cloud automatically.")
 
@@ -268,33 +432,56 @@ def main():
         if st.button("Add Habit"):
             if new_habit_name:
                 next_id = str(uuid.uuid4())
-                handler.update_habit(next_id, new_habit_name, new_habit_goal)
-                st.success(f"Added '{new_habit_name}'!")
-                st.rerun()
+                if handler.update_habit(next_id, new_habit_name, new_habit_goal):
+                    clear_data_caches()
+                    st.success(f"Added '{new_habit_name}'!")
+                    st.rerun()
+                else:
+                    st.error("Failed to save to GitHub. Please try again.")
             else:
                 st.error("Please enter a habit name.")
 
         if habits_df is not None and not habits_df.empty:
             st.write("Current Habits:")
-            # Remove legacy "Type" column for clean UI
-            display_df = habits_df.copy()
-            if "Type" in display_df.columns:
-                display_df = display_df.drop(columns=["Type"])
-
             edited_habits = st.data_editor(
-                display_df,
+                habits_df,
                 key="habit_editor",
                 hide_index=True,
+                column_config={
+                    # Hide the legacy "Type" column instead of dropping it
+                    "Type": None,
+                    # Same 1-31 day range as Add Habit
+                    "Monthly Goal": st.column_config.NumberColumn(
+                        min_value=1, max_value=31, step=1, required=True
+                    ),
+                },
             )
             if st.button("Save Changes"):
-                for _, row in edited_habits.iterrows():
-                    handler.update_habit(
-                        row["ID"],
-                        row["Habit Name"],
-                        row["Monthly Goal"],
+                # Only upload the rows that were actually edited
+                fields = ["ID", "Habit Name", "Monthly Goal"]
+                # Compare as objects: hand-edited gists can hold mixed-type goals
+                diff = (
+                    edited_habits[fields]
+                    .astype(object)
+                    .merge(
+                        habits_df[fields].astype(object),
+                        on="ID",
+                        how="left",
+                        suffixes=("", "_old"),
                     )
-                st.success("Updated habits!")
-                st.rerun()
+                )
+                changed = diff[
+                    (diff["Habit Name"] != diff["Habit Name_old"])
+                    | (diff["Monthly Goal"] != diff["Monthly Goal_old"])
+                ]
+                if changed.empty or handler.update_habits(
+                    changed[fields].to_dict("records")
+                ):
+                    clear_data_caches()
+                    st.success("Updated habits!")
+                    st.rerun()
+                else:
+                    st.error("Failed to save to GitHub. Please try again.")
 
         if habits_df is not None and not habits_df.empty:
             st.divider()
@@ -306,28 +493,31 @@ def main():
             )
 
             if st.button("Delete Selected Habit", type="secondary"):
-                h_id = habits_df[habits_df["Habit Name"] == habit_to_delete][
-                    "ID"
-                ].values[0]
-                handler.delete_habit(h_id)
-                st.warning(f"Deleted habit: {habit_to_delete}")
-                st.rerun()
+                name_to_id = dict(zip(habits_df["Habit Name"], habits_df["ID"]))
+                h_id = name_to_id[habit_to_delete]
+                if handler.delete_habit(h_id):
+                    clear_data_caches()
+                    st.warning(f"Deleted habit: {habit_to_delete}")
+                    st.rerun()
+                else:
+                    st.error("Failed to save to GitHub. Please try again.")
 
         # DANGER ZONE
         st.divider()
-        with st.expander("⚠️ Danger Zone - Delete All Data", expanded=False):
+        # Only build the reset controls once the user asks for them
+        if st.checkbox("⚠️ Show Danger Zone - Delete All Data", key="show_danger"):
             st.error(
                 "This action will permanently delete ALL habits, logs, and metrics."
             )
 
             # Generate random numbers for verification if not already present
-            if "reset_n1" not in st.session_state:
-                st.session_state.reset_n1 = random.randint(1, 50)
-            if "reset_n2" not in st.session_state:
-                st.session_state.reset_n2 = random.randint(1, 50)
-
-            n1 = st.session_state.reset_n1
-            n2 = st.session_state.reset_n2
+            nums = st.session_state.get("reset_nums")
+            if nums is None:
+                nums = st.session_state.reset_nums = (
+                    random.randint(1, 50),
+                    random.randint(1, 50),
+                )
+            n1, n2 = nums
 
             st.write(f"To confirm, please solve: **{n1} + {n2} = ?**")
             user_answer = st.text_input(
@@ -338,10 +528,11 @@ def main():
                 try:
                     if int(user_answer) == (n1 + n2):
                         if handler.reset_data():
+                            # Rebuild the handler so defaults are re-seeded
+                            clear_session_handler()
                             st.success("All data has been erased successfully.")
                             # Clear reset state to generate new numbers if they ever come back
-                            del st.session_state.reset_n1
-                            del st.session_state.reset_n2
+                            st.session_state.pop("reset_nums", None)
                             st.rerun()
                         else:
                             st.error(
@@ -352,7 +543,7 @@ def main():
                 except ValueError:
                     st.error("Please enter a valid number.")
 
-    with tab1:
+    if active_view == tab1:
         st.subheader(f"Tracking for {month_name} {year}")
 
         if habits_df is None or habits_df.empty:
@@ -366,254 +557,195 @@ def main():
                 key="log_date_selector",
             )
 
-            day_log = (
-                logs_df[logs_df["Date"] == pd.to_datetime(selected_date)]
-                if logs_df is not None
-                and not logs_df.empty
-                and "Date" in logs_df.columns
-                else pd.DataFrame()
-            )
-            day_metrics = (
-                metrics_df[metrics_df["Date"] == pd.to_datetime(selected_date)]
-                if metrics_df is not None
-                and not metrics_df.empty
-                and "Date" in metrics_df.columns
-                else pd.DataFrame()
-            )
-
-            col1, col2 = st.columns([2, 1])
-
-            with col1:
-                st.write("Habit List")
-                habit_completions = {}
-                for _, row in habits_df.iterrows():
-                    h_id = f"H{row['ID']}"
-                    current_val = "Pending"
-                    if not day_log.empty and h_id in day_log.columns:
-                        try:
-                            val = day_log[h_id].values[0]
-                            if val == True or val == "Yes":
-                                current_val = "Yes"
-                            elif val == False or val == "No":
-                                current_val = "No"
-                        except:
-                            current_val = "Pending"
-
-                    st.markdown(
-                        f"**<span style='color:#2ECC71;'>🚀 {row['Habit Name']}</span>**",
-                        unsafe_allow_html=True,
-                    )
-                    habit_completions[h_id] = st.radio(
-                        "Status",
-                        ["Pending", "Yes", "No"],
-                        index=["Pending", "Yes", "No"].index(current_val),
-                        key=f"radio_{h_id}",
-                        horizontal=True,
-                        label_visibility="collapsed",
+            # Hash lookups into the month's records instead of scanning the frames
+            date_key = selected_date.strftime("%Y-%m-%d")
+            day_values = logs_by_date.get(date_key, {})
+            day_metrics = metrics_by_date.get(date_key, {})
+
+            # Widgets inside the form only rerun the script on submit
+            with st.form("daily_log_form"):
+                col1, col2 = st.columns([2, 1])
+
+                with col1:
+                    st.write("Habit List")
+                    h_ids = [f"H{habit_id}" for habit_id in habits_df["ID"]]
+                    statuses = []
+                    for h_id in h_ids:
+                        val = day_values.get(h_id)
+                        if val in _YES:
+                            statuses.append("Yes")
+                        elif val in _NO:
+                            statuses.append("No")
+                        else:
+                            statuses.append("Pending")
+
+                    # One editor for the whole list instead of a markdown + radio per habit
+                    edited_status = st.data_editor(
+                        pd.DataFrame(
+                            {
+                                "Habit": habits_df["Habit Name"].to_numpy(),
+                                "Status": statuses,
+                            }
+                        ),
+                        column_config={
+                            "Habit": st.column_config.TextColumn(
+                                "🚀 Habit", disabled=True
+                            ),
+                            "Status": st.column_config.SelectboxColumn(
+                                options=["Pending", "Yes", "No"], required=True
+                            ),
+                        },
+                        hide_index=True,
+                        width="stretch",
+                        key=f"daily_editor_{date_key}",
                     )
+                    habit_completions = dict(zip(h_ids, edited_status["Status"]))
 
-            with col2:
-                st.write("Other Metrics")
+                with col2:
+                    st.write("Other Metrics")
 
-                def get_metric_val(df, col, default):
-                    if not df.empty and col in df.columns:
+                    def get_metric_val(values, col, default):
                         try:
-                            val = df[col].values[0]
+                            val = values.get(col)
                             return int(val) if pd.notnull(val) else default
-                        except:
+                        except (TypeError, ValueError):
                             return default
-                    return default
 
-                screen_time = st.number_input(
-                    "Screen Time (min)",
-                    min_value=0,
-                    value=get_metric_val(day_metrics, "Screen Time (min)", 0),
-                )
-                mood = st.slider(
-                    "Mood (1-10)",
-                    1,
-                    10,
-                    value=get_metric_val(day_metrics, "Mood (1-10)", 5),
-                )
-                energy = st.slider(
-                    "Energy (1-10)",
-                    1,
-                    10,
-                    value=get_metric_val(day_metrics, "Energy (1-10)", 5),
-                )
+                    screen_time = st.number_input(
+                        "Screen Time (min)",
+                        min_value=0,
+                        value=get_metric_val(day_metrics, "Screen Time (min)", 0),
+                    )
+                    mood = st.slider(
+                        "Mood (1-10)",
+                        1,
+                        10,
+                        value=get_metric_val(day_metrics, "Mood (1-10)", 5),
+                    )
+                    energy = st.slider(
+                        "Energy (1-10)",
+                        1,
+                        10,
+                        value=get_metric_val(day_metrics, "Energy (1-10)", 5),
+                    )
 
-                ach_val = ""
-                if not day_metrics.empty and "Achievements" in day_metrics.columns:
-                    ach_val = day_metrics["Achievements"].values[0]
+                    ach_val = day_metrics.get("Achievements")
                     if pd.isnull(ach_val):
                         ach_val = ""
 
-                achievements = st.text_area("Achievements", value=ach_val)
-
-            if st.button("Save Daily Log", type="primary"):
-                with st.spinner("Saving to cloud..."):
-                    handler.save_log(selected_date, habit_completions)
-                    handler.save_metrics(
-                        selected_date, screen_time, mood, energy, achievements
-                    )
-                st.success("Saved successfully!")
-                st.rerun()
+                    achievements = st.text_area("Achievements", value=ach_val)
+
+                submitted = st.form_submit_button("Save Daily Log", type="primary")
+                if submitted:
+                    with st.spinner("Saving to cloud..."):
+                        saved = handler.save_day(
+                            selected_date,
+                            habit_completions,
+                            screen_time,
+                            mood,
+                            energy,
+                            achievements,
+                        )
+                    if saved:
+                        clear_data_caches()
+                        st.success("Saved successfully!")
+                        st.rerun()
+                    else:
+                        st.error("Failed to save to GitHub. Please try again.")
 
-    with tab2:
+    if active_view == tab2:
         st.subheader("Visual Dashboard")
-        stats = calculate_completion_stats(logs_df, habits_df)
+        if habits_df is None or habits_df.empty or logs_df is None or logs_df.empty:
+            st.info("No data yet - log a few days to see your dashboard.")
+        else:
+            stats = calculate_completion_stats(logs_df, habits_df)
 
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.plotly_chart(
-                create_donut_chart(stats["overall_rate"]), use_container_width=True
-            )
-            st.markdown("</div>", unsafe_allow_html=True)
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                st.plotly_chart(
+                    create_donut_chart(stats["overall_rate"]), use_container_width=True
+                )
+                st.markdown("</div>", unsafe_allow_html=True)
 
-        with c2:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Total Habits", len(habits_df) if habits_df is not None else 0)
-            st.metric("Total Months Tracked", len(handler.get_all_available_months()))
-            st.markdown("</div>", unsafe_allow_html=True)
+            with c2:
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                st.metric(
+                    "Total Habits", len(habits_df) if habits_df is not None else 0
+                )
+                st.metric(
+                    "Total Months Tracked",
+                    len(
+                        load_available_months(
+                            handler, handler.source(), handler.content_version()
+                        )
+                    ),
+                )
+                st.markdown("</div>", unsafe_allow_html=True)
 
-        st.plotly_chart(
-            create_tug_of_war_chart(stats["good_vs_bad"]), use_container_width=True
-        )
+            st.plotly_chart(
+                create_tug_of_war_chart(stats["good_vs_bad"]), use_container_width=True
+            )
 
-        st.plotly_chart(
-            create_habit_performance_chart(habits_df, logs_df),
-            use_container_width=True,
-        )
+            st.plotly_chart(
+                create_habit_performance_chart(stats["habit_breakdown"]),
+                use_container_width=True,
+            )
 
-        with c3:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            if not stats["top_habits"].empty:
-                st.write("Top Habits:")
-                st.dataframe(
-                    stats["top_habits"][["Habit Name", "Total Completed"]].head(5),
-                    hide_index=True,
-                )
-            else:
-                st.write("Top Habits: No data yet")
-            st.markdown("</div>", unsafe_allow_html=True)
+            with c3:
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                if not stats["top_habits"].empty:
+                    st.write("Top Habits:")
+                    st.dataframe(
+                        stats["top_habits"][["Habit Name", "Total Completed"]].head(5),
+                        hide_index=True,
+                    )
+                else:
+                    st.write("Top Habits: No data yet")
+                st.markdown("</div>", unsafe_allow_html=True)
 
-        st.plotly_chart(
-            create_line_chart(stats["daily_consistency"]), use_container_width=True
-        )
+            st.plotly_chart(
+                create_line_chart(stats["daily_consistency"]), use_container_width=True
+            )
 
-        st.plotly_chart(
-            create_bar_chart(stats["weekly_comparison"]), use_container_width=True
-        )
+            st.plotly_chart(
+                create_bar_chart(stats["weekly_comparison"]), use_container_width=True
+            )
 
-    with tab4:
+    if active_view == tab4:
         st.subheader("📈 Long-term Habit Analysis")
         st.info("This view aggregates all your historical data from every month.")
 
         with st.spinner("Fetching historical data..."):
-            all_history = handler.load_all_history()
+            summaries = load_month_summaries(
+                handler, handler.source(), handler.content_version()
+            )
 
-        if not all_history["logs"]:
+        if not summaries:
             st.warning(
                 "No historical data found yet. Keep tracking to see your progress trends!"
             )
         else:
-            fig_trends = create_overall_trends_chart(all_history)
+            fig_trends = create_overall_trends_chart(summaries)
             st.plotly_chart(fig_trends, use_container_width=True)
 
             # Additional insights
             st.divider()
             st.subheader("Month-by-Month Summary")
-            all_months = handler.get_all_available_months()
+            all_months = load_available_months(
+                handler, handler.source(), handler.content_version()
+            )
             summary_data = []
             for y, m in all_months:
-                import calendar as cal
-
-                m_name = cal.month_name[m]
+                m_name = _MONTH_NAMES[m]
                 summary_data.append(
                     {"Month": f"{m_name} {y}", "Source": f"data_{y}_{m:02d}.json"}
                 )
 
             st.table(pd.DataFrame(summary_data))
 
-    with tab5:
-        st.subheader(f"🖋️ Daily Journal - {month_name} {year}")
-
-        # Date selector for journal
-        j_date = st.date_input(
-            "Journal Date",
-            datetime.date.today(),
-            min_value=start_date,
-            max_value=end_date,
-            key="journal_date_selector",
-        )
-
-        # Load journal for the selected month
-        journal_data = handler.load_journal(year, month)
-        date_str = j_date.strftime("%Y-%m-%d")
-        current_entry = journal_data.get(date_str, "")
-
-        journal_content = st.text_area(
-            "Write your thoughts here...",
-            value=current_entry,
-            height=300,
-            key=f"journal_input_{date_str}",
-        )
-
-        if st.button("Save Journal Entry", type="primary"):
-            with st.spinner("Saving journal..."):
-                handler.save_journal(j_date, journal_content)
-            st.success("Journal entry saved!")
-            st.rerun()
-
-        st.divider()
-        st.subheader("📥 Export Journal")
-
-        if st.button("Generate Monthly PDF"):
-            if not journal_data:
-                st.warning("No journal entries found for this month.")
-            else:
-                try:
-                    pdf = FPDF()
-                    pdf.set_auto_page_break(auto=True, margin=15)
-                    pdf.add_page()
-                    pdf.set_font("Arial", "B", 16)
-                    pdf.cell(
-                        0,
-                        10,
-                        f"Habit Tracker Journal - {month_name} {year}",
-                        ln=True,
-                        align="C",
-                    )
-                    pdf.ln(10)
-
-                    # Sort entries by date
-                    for d_str in sorted(journal_data.keys()):
-                        content = journal_data[d_str]
-                        if content.strip():
-                            pdf.set_font("Arial", "B", 12)
-                            pdf.cell(0, 10, f"Date: {d_str}", ln=True)
-                            pdf.set_font("Arial", "", 11)
-                            pdf.multi_cell(0, 8, content)
-                            pdf.ln(5)
-
-                    pdf_output = pdf.output()
-                    st.download_button(
-                        label="Download PDF",
-                        data=bytes(pdf_output),
-                        file_name=f"Journal_{year}_{month:02d}.pdf",
-                        mime="application/pdf",
-                    )
-                except Exception as e:
-                    st.error(f"Error generating PDF: {e}")
-
-        # Quick view of past entries this month
-        if journal_data:
-            with st.expander("📖 View Past Entries (This Month)"):
-                for d_str in sorted(journal_data.keys(), reverse=True):
-                    if journal_data[d_str].strip():
-                        st.markdown(f"**{d_str}**")
-                        st.info(journal_data[d_str])
+    if active_view == tab5:
+        journal_view(handler, year, month, month_name, start_date, end_date)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,52 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import pandas as pd
 import datetime
+import hashlib
 import os
+import time
 import uuid
 
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used when it is missing
+    orjson = None
+
+
+def _loads(content):
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
+def _dumps(data, pretty=False):
+    if orjson:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode()
+    if pretty:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _to_number(series):
+    """Parses a hand-editable numeric column, using the smallest int dtype that fits."""
+    numbers = pd.to_numeric(series, errors="coerce", downcast="integer")
+    # Leave the column as stored if any value isn't a number
+    if numbers.notna().sum() != series.notna().sum():
+        return series
+    return numbers
+
 
 class GithubHandler:
+    # Seconds a fetched file listing is reused before asking the gist again
+    FILES_MAX_AGE = 60
+    # Indent stored JSON for reading in the gist UI, at about twice the size
+    PRETTY_JSON = False
+
+    METRIC_COLUMNS = ("Screen Time (min)", "Mood (1-10)", "Energy (1-10)")
+
     def __init__(self, token=None, gist_id=None, local=False):
         self.token = token
         self.gist_id = gist_id
@@ -24,9 +64,21 @@ class GithubHandler:
             else {}
         )
 
+        # Pooled keep-alive session so repeat calls skip the TLS handshake
+        self._sess = self._make_session(self.headers)
+
         if self.local and not os.path.exists(self.local_dir):
             os.makedirs(self.local_dir)
 
+        # filename -> digest of the content last read from or written to the gist
+        self._last_hashes = {}
+        # Last file listing, and the gist ETag it was revalidated with
+        self._files_cache = None
+        self._files_fetched_at = 0.0
+        self._gist_etag = None
+        # Truncated files whose raw_url could not be read; never overwritten
+        self._unreadable_files = set()
+
         self.habits = []
         self.current_month_data = {"logs": [], "metrics": []}
         self.current_journal_data = {}
@@ -34,6 +86,35 @@ class GithubHandler:
         self.current_month = None
 
         self._initial_load_and_migrate()
+        self._index_habits()
+        self._index_month()
+
+    def _index_habits(self):
+        # Entries are shared with self.habits, so edits through the index are saved
+        self._habit_by_id = {str(h.get("ID")): h for h in self.habits}
+
+    def _index_month(self):
+        # Built in reverse so the first record wins for a duplicated date
+        self._log_by_date = {
+            l.get("Date"): l for l in reversed(self.current_month_data["logs"])
+        }
+        self._metric_by_date = {
+            m.get("Date"): m for m in reversed(self.current_month_data["metrics"])
+        }
+
+    @staticmethod
+    def _make_session(headers):
+        sess = requests.Session()
+        sess.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        sess.mount("https://", adapter)
+        return sess
 
     def _initial_load_and_migrate(self):
         """Loads habits and checks if migration from old single-file format is needed."""
@@ -41,7 +122,7 @@ class GithubHandler:
 
         # 1. Check for legacy file and migrate if needed
         if self.old_filename in fetch_all:
-            legacy_data = json.loads(fetch_all[self.old_filename])
+            legacy_data = _loads(fetch_all[self.old_filename])
             self.habits = legacy_data.get("habits", [])
 
             # Split logs/metrics by month
@@ -49,40 +130,44 @@ class GithubHandler:
             metrics = legacy_data.get("metrics", [])
 
             monthly_buckets = {}
-            for entry in logs + metrics:
-                d = datetime.datetime.strptime(entry["Date"], "%Y-%m-%d")
-                key = f"data_{d.year}_{d.month:02d}.json"
-                if key not in monthly_buckets:
-                    monthly_buckets[key] = {"logs": [], "metrics": []}
-
-                if "Mood (1-10)" in entry:  # Metric
-                    monthly_buckets[key]["metrics"].append(entry)
-                else:  # Log
-                    monthly_buckets[key]["logs"].append(entry)
-
-            # Save migrated files
-            self._save_habits()
-            for filename, data in monthly_buckets.items():
-                self._upload_to_gist(filename, data)
-
-            # Delete legacy file
-            self._delete_from_gist(self.old_filename)
+            # Walk each list in place and keep the kind it came from
+            for kind, entries in (("logs", logs), ("metrics", metrics)):
+                for entry in entries:
+                    date_str = entry["Date"]
+                    # Slice zero-padded YYYY-MM-DD dates; parse anything else
+                    if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+                        key = f"data_{date_str[:4]}_{date_str[5:7]}.json"
+                    else:
+                        d = datetime.datetime.strptime(date_str, "%Y-%m-%d")
+                        key = f"data_{d.year}_{d.month:02d}.json"
+                    if key not in monthly_buckets:
+                        monthly_buckets[key] = {"logs": [], "metrics": []}
+                    monthly_buckets[key][kind].append(entry)
+
+            # Save migrated files and delete the legacy one in a single request
+            self._patch_gist(
+                {
+                    self.habits_filename: self.habits,
+                    **monthly_buckets,
+                    self.old_filename: None,
+                }
+            )
         else:
             # 2. Normal load of habits
             if self.habits_filename in fetch_all:
-                self.habits = json.loads(fetch_all[self.habits_filename])
+                self.habits = _loads(fetch_all[self.habits_filename])
             elif self.local:
                 habits_path = os.path.join(self.local_dir, self.habits_filename)
                 if os.path.exists(habits_path):
-                    with open(habits_path, "r") as f:
-                        self.habits = json.load(f)
+                    with open(habits_path, "r", encoding="utf-8") as f:
+                        self.habits = _loads(f.read())
 
             # 3. If still empty, populate with default habits from JSON
             if not self.habits:
                 default_file = "default_habits.json"
                 if os.path.exists(default_file):
-                    with open(default_file, "r") as f:
-                        defaults = json.load(f)
+                    with open(default_file, "r", encoding="utf-8") as f:
+                        defaults = _loads(f.read())
                         # Add IDs to defaults
                         for h in defaults:
                             if "ID" not in h:
@@ -92,50 +177,123 @@ class GithubHandler:
                     self.habits = []
                 self._save_habits()
 
-    def _fetch_all_gist_files(self):
-        """Returns a dict of filename -> content for all files in the gist."""
+    def _fetch_all_gist_files(self, force=False):
+        """Returns a dict of filename -> content for all files in the gist.
+
+        A listing younger than FILES_MAX_AGE seconds is reused; writes keep it current.
+        """
+        files = self._fetch_files(force)
+        return files if files is not None else {}
+
+    def _fetch_files(self, force=False):
+        """Like _fetch_all_gist_files, but returns None when the gist can't be read."""
+        if (
+            not force
+            and self._files_cache is not None
+            and time.monotonic() - self._files_fetched_at < self.FILES_MAX_AGE
+        ):
+            return self._files_cache
+
+        files = None
         if self.local:
             files = {}
             if os.path.exists(self.local_dir):
-                for f in os.listdir(self.local_dir):
-                    if f.endswith(".json"):
-                        with open(os.path.join(self.local_dir, f), "r") as file:
-                            files[f] = file.read()
-            return files
-
-        if not self.token or not self.gist_id:
-            return {}
+                # scandir reuses the directory entry's type instead of a stat per file
+                with os.scandir(self.local_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json") and entry.is_file():
+                            with open(entry.path, "r", encoding="utf-8") as file:
+                                files[entry.name] = file.read()
+        elif self.token and self.gist_id:
+            try:
+                url = f"https://api.github.com/gists/{self.gist_id}"
+                headers = {"If-None-Match": self._gist_etag} if self._gist_etag else {}
+                response = self._sess.get(url, headers=headers)
+                if response.status_code == 304 and self._files_cache is not None:
+                    # Unchanged since the last fetch; 304s don't count against the rate limit
+                    files = self._files_cache
+                elif response.status_code == 200:
+                    gist_data = response.json()
+                    files = {}
+                    self._unreadable_files = set()
+                    for name, info in gist_data["files"].items():
+                        content = self._file_content(info)
+                        if content is None:
+                            self._unreadable_files.add(name)
+                        else:
+                            files[name] = content
+                    self._gist_etag = response.headers.get("ETag")
+            except (requests.RequestException, KeyError):
+                pass
+        if files is None:
+            return None
+
+        self._files_cache = files
+        self._files_fetched_at = time.monotonic()
+        self._remember_hashes(files)
+        return files
+
+    def _file_content(self, info):
+        # The gist API cuts content off at about 1 MB; the raw URL has the full file
+        if not info.get("truncated"):
+            return info["content"]
         try:
-            url = f"https://api.github.com/gists/{self.gist_id}"
-            response = requests.get(url, headers=self.headers)
-            if response.status_code == 200:
-                gist_data = response.json()
-                return {
-                    name: info["content"] for name, info in gist_data["files"].items()
-                }
-        except:
-            pass
-        return {}
-
-    def load_month(self, year, month):
-        """Loads logs and metrics for a specific month."""
+            response = self._sess.get(info["raw_url"])
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException:
+            # Leave just this file out rather than failing the whole listing
+            return None
+
+    def refresh(self, year, month):
+        """Re-reads habits and a month from the latest listing, picking up other sessions' edits."""
+        files = self._fetch_all_gist_files()
+        if self.habits_filename in files:
+            self.habits = _loads(files[self.habits_filename])
+            self._index_habits()
+        self.load_month(year, month)
+
+    def source(self):
+        """Identifies the gist or local directory this handler reads, for cache keys."""
+        return ("local", self.local_dir) if self.local else ("gist", self.gist_id)
+
+    def content_version(self, *filenames):
+        """Digests of the named files (default: all) as last read or written, for cache keys."""
+        names = filenames or sorted(self._last_hashes)
+        return tuple((name, self._last_hashes.get(name)) for name in names)
+
+    def load_month(self, year, month, force=False):
+        """Loads logs and metrics for a specific month.
+
+        With force=True the gist is revalidated first, and None is returned
+        (leaving the loaded month untouched) if it can't be read.
+        """
+        files = self._fetch_files(force)
+        if files is None:
+            if force:
+                return None
+            files = {}
         self.current_year = year
         self.current_month = month
         filename = f"data_{year}_{month:02d}.json"
 
-        files = self._fetch_all_gist_files()
         if filename in files:
-            self.current_month_data = json.loads(files[filename])
+            self.current_month_data = _loads(files[filename])
         else:
             self.current_month_data = {"logs": [], "metrics": []}
+        self._index_month()
         return self.current_month_data
 
-    def load_journal(self, year, month):
-        """Loads journal entries for a specific month."""
+    def load_journal(self, year, month, force=False):
+        """Loads journal entries for a specific month; force works as in load_month."""
         filename = f"journal_{year}_{month:02d}.json"
-        files = self._fetch_all_gist_files()
+        files = self._fetch_files(force)
+        if files is None:
+            if force:
+                return None
+            files = {}
         if filename in files:
-            self.current_journal_data = json.loads(files[filename])
+            self.current_journal_data = _loads(files[filename])
         else:
             self.current_journal_data = {}
         return self.current_journal_data
@@ -151,139 +309,231 @@ class GithubHandler:
                     months.append((int(parts[0]), int(parts[1])))
         return sorted(months)
 
+    def iter_month_data(self):
+        """Yields (year, month, month_data) for each monthly data file, oldest first."""
+        files = self._fetch_all_gist_files()
+        for f in sorted(files):
+            if f.startswith("data_") and f.endswith(".json"):
+                parts = f.replace("data_", "").replace(".json", "").split("_")
+                if len(parts) == 2:
+                    yield int(parts[0]), int(parts[1]), _loads(files[f])
+
     def load_all_history(self):
         """Fetches every monthly data file and returns a merged dictionary of ALL logs and metrics."""
-        files = self._fetch_all_gist_files()
         all_logs = []
         all_metrics = []
-        for f, content in files.items():
-            if f.startswith("data_") and f.endswith(".json"):
-                month_data = json.loads(content)
-                all_logs.extend(month_data.get("logs", []))
-                all_metrics.extend(month_data.get("metrics", []))
+        for _, _, month_data in self.iter_month_data():
+            all_logs.extend(month_data.get("logs", []))
+            all_metrics.extend(month_data.get("metrics", []))
         return {"logs": all_logs, "metrics": all_metrics}
 
+    def _reload_habits(self):
+        """Re-reads habits.json before an edit; False if the gist can't be read."""
+        files = self._fetch_files(force=True)
+        if files is None:
+            return False
+        if self.habits_filename in files:
+            self.habits = _loads(files[self.habits_filename])
+            self._index_habits()
+        return True
+
     def _save_habits(self):
-        self._upload_to_gist(self.habits_filename, self.habits)
+        return self._upload_to_gist(self.habits_filename, self.habits)
 
     def _save_current_month(self):
         if self.current_year and self.current_month:
             filename = f"data_{self.current_year}_{self.current_month:02d}.json"
-            self._upload_to_gist(filename, self.current_month_data)
+            return self._upload_to_gist(filename, self.current_month_data)
+        return False
+
+    @staticmethod
+    def _digest(content):
+        return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+    def _remember_hashes(self, files):
+        self._last_hashes = {name: self._digest(c) for name, c in files.items()}
+
+    def _patch_gist(self, files):
+        """Writes several files in one request; a value of None deletes that file."""
+        if any(
+            name in self._unreadable_files and data is not None
+            for name, data in files.items()
+        ):
+            # We only hold part of that file, so writing it would drop the rest
+            return False
+        pending = {}
+        for filename, data in files.items():
+            if data is None:
+                pending[filename] = None
+                continue
+            content = _dumps(data, self.PRETTY_JSON)
+            digest = self._digest(content)
+            # Skip files that already hold exactly this content
+            if self._last_hashes.get(filename) != digest:
+                pending[filename] = (content, digest)
+        if not pending:
+            return True
 
-    def _upload_to_gist(self, filename, data):
         if self.local:
-            with open(os.path.join(self.local_dir, filename), "w") as f:
-                json.dump(data, f, indent=2)
+            for filename, entry in pending.items():
+                path = os.path.join(self.local_dir, filename)
+                if entry is None:
+                    if os.path.exists(path):
+                        os.remove(path)
+                else:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(entry[0])
+            self._record_written(pending)
             return True
 
         if not self.token or not self.gist_id:
             return False
         try:
             url = f"https://api.github.com/gists/{self.gist_id}"
-            payload = {"files": {filename: {"content": json.dumps(data, indent=2)}}}
-            response = requests.patch(url, headers=self.headers, json=payload)
-            return response.status_code == 200
-        except:
+            payload = {
+                "files": {
+                    name: None if entry is None else {"content": entry[0]}
+                    for name, entry in pending.items()
+                }
+            }
+            response = self._sess.patch(url, json=payload)
+            if response.status_code == 200:
+                self._record_written(pending)
+                return True
+            return False
+        except requests.RequestException:
             return False
 
+    def _record_written(self, pending):
+        for filename, entry in pending.items():
+            if entry is None:
+                self._last_hashes.pop(filename, None)
+                if self._files_cache is not None:
+                    self._files_cache.pop(filename, None)
+            else:
+                self._last_hashes[filename] = entry[1]
+                if self._files_cache is not None:
+                    self._files_cache[filename] = entry[0]
+
+    def _upload_to_gist(self, filename, data):
+        return self._patch_gist({filename: data})
+
     def _delete_from_gist(self, filename):
-        if self.local:
-            path = os.path.join(self.local_dir, filename)
-            if os.path.exists(path):
-                os.remove(path)
-            return True
-        try:
-            url = f"https://api.github.com/gists/{self.gist_id}"
-            payload = {"files": {filename: None}}
-            requests.patch(url, headers=self.headers, json=payload)
-        except:
-            pass
+        return self._patch_gist({filename: None})
 
     def get_habits(self):
-        return pd.DataFrame(self.habits)
+        df = pd.DataFrame(self.habits)
+        if "Monthly Goal" in df.columns:
+            df["Monthly Goal"] = _to_number(df["Monthly Goal"])
+        return df
+
+    def _apply_habit(self, habit_id, name, goal):
+        h = self._habit_by_id.get(str(habit_id))
+        if h is not None:
+            h["Habit Name"] = name
+            h["Monthly Goal"] = goal
+        else:
+            h = {"ID": habit_id, "Habit Name": name, "Monthly Goal": goal}
+            self.habits.append(h)
+            self._habit_by_id[str(habit_id)] = h
 
     def update_habit(self, habit_id, name, goal):
-        updated = False
-        for h in self.habits:
-            if str(h.get("ID")) == str(habit_id):
-                h["Habit Name"] = name
-                h["Monthly Goal"] = goal
-                updated = True
-                break
-        if not updated:
-            self.habits.append(
-                {"ID": habit_id, "Habit Name": name, "Monthly Goal": goal}
-            )
-        self._save_habits()
+        if not self._reload_habits():
+            return False
+        self._apply_habit(habit_id, name, goal)
+        return self._save_habits()
+
+    def update_habits(self, rows):
+        """Applies several habit edits (ID, Habit Name, Monthly Goal) in one upload."""
+        if not self._reload_habits():
+            return False
+        for row in rows:
+            self._apply_habit(row["ID"], row["Habit Name"], row["Monthly Goal"])
+        return self._save_habits()
 
     def delete_habit(self, habit_id):
+        if not self._reload_habits():
+            return False
         self.habits = [h for h in self.habits if str(h.get("ID")) != str(habit_id)]
-        self._save_habits()
+        self._habit_by_id.pop(str(habit_id), None)
+        return self._save_habits()
         # Note: We don't clean up logs across all monthly files for performance,
         # analytics should handle missing IDs.
 
     def reset_data(self):
-        files = self._fetch_all_gist_files()
-        for f in files.keys():
-            if f.endswith(".json"):
-                self._delete_from_gist(f)
+        files = self._fetch_all_gist_files(force=True)
+        ok = self._patch_gist({f: None for f in files if f.endswith(".json")})
+        # The files are gone; stale digests would skip re-uploading identical content
+        self._last_hashes = {}
+
         self.habits = []
         self.current_month_data = {"logs": [], "metrics": []}
-        return True
+        self._index_habits()
+        self._index_month()
+        return ok
+
+    @staticmethod
+    def _categorize_habit_cells(df, habit_cols):
+        """Stores habit columns as a No/Yes categorical, folding in legacy booleans."""
+        labels = {"Yes": "Yes", True: "Yes", "No": "No", False: "No"}
+        status = pd.CategoricalDtype(["No", "Yes"])
+        for c in habit_cols:
+            df[c] = df[c].map(labels).astype(status)
+        return df
 
     def get_logs(self, start_date=None, end_date=None):
         # Optimized to use current loaded month unless dates suggest otherwise
         df = pd.DataFrame(self.current_month_data["logs"])
         if df.empty:
             return df
-        df["Date"] = pd.to_datetime(df["Date"])
+        df["Date"] = pd.to_datetime(df["Date"], format="%Y-%m-%d")
+        # Analytics reads the habit columns from attrs instead of rescanning
+        habit_cols = tuple(c for c in df.columns if c.startswith("H"))
+        df = self._categorize_habit_cells(df, habit_cols)
+        df.attrs["habit_cols"] = habit_cols
         if start_date and end_date:
-            mask = (df["Date"] >= pd.to_datetime(start_date)) & (
-                df["Date"] <= pd.to_datetime(end_date)
-            )
+            mask = df["Date"].between(pd.Timestamp(start_date), pd.Timestamp(end_date))
             return df.loc[mask]
         return df
 
+    def _ensure_month(self, date):
+        # Reload the target month so edits saved elsewhere since the last read are kept
+        return self.load_month(date.year, date.month, force=True) is not None
+
+    def _apply_log(self, date_str, habit_completions):
+        log = self._log_by_date.get(date_str)
+        if log is not None:
+            log.update(habit_completions)
+        else:
+            log = {"Date": date_str}
+            log.update(habit_completions)
+            self.current_month_data["logs"].append(log)
+            self._log_by_date[date_str] = log
+
     def save_log(self, date, habit_completions):
-        date_str = date.strftime("%Y-%m-%d")
-        # Ensure we are saving to the correct month file
-        if date.year != self.current_year or date.month != self.current_month:
-            self.load_month(date.year, date.month)
-
-        logs = self.current_month_data["logs"]
-        updated = False
-        for l in logs:
-            if l.get("Date") == date_str:
-                l.update(habit_completions)
-                updated = True
-                break
-        if not updated:
-            new_log = {"Date": date_str}
-            new_log.update(habit_completions)
-            logs.append(new_log)
-
-        self.current_month_data["logs"] = logs
-        self._save_current_month()
+        if not self._ensure_month(date):
+            return False
+        self._apply_log(date.strftime("%Y-%m-%d"), habit_completions)
+        return self._save_current_month()
+
+    def get_day_records(self):
+        """Returns the loaded month's logs and metrics keyed by their Date string."""
+        return dict(self._log_by_date), dict(self._metric_by_date)
 
     def get_metrics(self, start_date=None, end_date=None):
         df = pd.DataFrame(self.current_month_data["metrics"])
         if df.empty:
             return df
-        df["Date"] = pd.to_datetime(df["Date"])
+        df["Date"] = pd.to_datetime(df["Date"], format="%Y-%m-%d")
+        for c in self.METRIC_COLUMNS:
+            if c in df.columns:
+                df[c] = _to_number(df[c])
         if start_date and end_date:
-            mask = (df["Date"] >= pd.to_datetime(start_date)) & (
-                df["Date"] <= pd.to_datetime(end_date)
-            )
+            mask = df["Date"].between(pd.Timestamp(start_date), pd.Timestamp(end_date))
             return df.loc[mask]
         return df
 
-    def save_metrics(self, date, screen_time, mood, energy, achievements):
-        date_str = date.strftime("%Y-%m-%d")
-        if date.year != self.current_year or date.month != self.current_month:
-            self.load_month(date.year, date.month)
-
-        metrics = self.current_month_data["metrics"]
+    def _apply_metrics(self, date_str, screen_time, mood, energy, achievements):
         values = {
             "Date": date_str,
             "Screen Time (min)": screen_time,
@@ -292,34 +542,43 @@ class GithubHandler:
             "Achievements": achievements,
         }
 
-        updated = False
-        for m in metrics:
-            if m.get("Date") == date_str:
-                m.update(values)
-                updated = True
-                break
-        if not updated:
-            metrics.append(values)
+        m = self._metric_by_date.get(date_str)
+        if m is not None:
+            m.update(values)
+        else:
+            self.current_month_data["metrics"].append(values)
+            self._metric_by_date[date_str] = values
+
+    def save_metrics(self, date, screen_time, mood, energy, achievements):
+        if not self._ensure_month(date):
+            return False
+        self._apply_metrics(
+            date.strftime("%Y-%m-%d"), screen_time, mood, energy, achievements
+        )
+        return self._save_current_month()
 
-        self.current_month_data["metrics"] = metrics
-        self._save_current_month()
+    def save_day(
+        self, date, habit_completions, screen_time, mood, energy, achievements
+    ):
+        """Saves a day's habit log and metrics with a single upload of the month file."""
+        if not self._ensure_month(date):
+            return False
+        date_str = date.strftime("%Y-%m-%d")
+        self._apply_log(date_str, habit_completions)
+        self._apply_metrics(date_str, screen_time, mood, energy, achievements)
+        return self._save_current_month()
 
     def save_journal(self, date, content):
         date_str = date.strftime("%Y-%m-%d")
         year, month = date.year, date.month
         filename = f"journal_{year}_{month:02d}.json"
 
-        # Check if we need to load a different month's journal
-        current_journal_filename = (
-            f"journal_{self.current_year}_{self.current_month:02d}.json"
-            if self.current_year
-            else None
-        )
-        if filename != current_journal_filename:
-            self.load_journal(year, month)
+        # Reload the month's journal so entries saved elsewhere are kept
+        if self.load_journal(year, month, force=True) is None:
+            return False
 
         self.current_journal_data[date_str] = content
-        self._upload_to_gist(filename, self.current_journal_data)
+        return self._upload_to_gist(filename, self.current_journal_data)
 
     @staticmethod
     def create_or_find_gist(token):
@@ -327,29 +586,28 @@ class GithubHandler:
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json",
         }
-        # Check for new version file first
+        # Check for new version file first; both calls share one connection
         try:
-            response = requests.get("https://api.github.com/gists", headers=headers)
-            if response.status_code == 200:
-                gists = response.json()
-                for gist in gists:
-                    if (
-                        "habits.json" in gist["files"]
-                        or "habit_tracker_data.json" in gist["files"]
-                    ):
-                        return gist["id"]
-
-            # Create new if none found
-            payload = {
-                "description": "Habit Tracker Data",
-                "public": False,
-                "files": {"habits.json": {"content": "[]"}},
-            }
-            response = requests.post(
-                "https://api.github.com/gists", headers=headers, json=payload
-            )
-            if response.status_code == 201:
-                return response.json()["id"]
-        except:
+            with GithubHandler._make_session(headers) as sess:
+                response = sess.get("https://api.github.com/gists")
+                if response.status_code == 200:
+                    gists = response.json()
+                    for gist in gists:
+                        if (
+                            "habits.json" in gist["files"]
+                            or "habit_tracker_data.json" in gist["files"]
+                        ):
+                            return gist["id"]
+
+                # Create new if none found
+                payload = {
+                    "description": "Habit Tracker Data",
+                    "public": False,
+                    "files": {"habits.json": {"content": "[]"}},
+                }
+                response = sess.post("https://api.github.com/gists", json=payload)
+                if response.status_code == 201:
+                    return response.json()["id"]
+        except (requests.RequestException, KeyError):
             pass
         return None